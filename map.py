@@ -1,29 +1,13 @@
 # Import libraries
 import pygame                       # For rendering graphics and handling input
 import math                         # For mathematical functions (especially hexagon geometry)
-import heapq                       
-from itertools import permutations  #imports and constants remain unchanged
+from collections import Counter, deque  # Path bookkeeping in the game loop
 
-# ------------------------ Map Definitions ------------------------ #
-START    = 'S'                      # Start tile symbol
-TREASURE = 'T'                      # Treasure tile symbol
-BLOCKED  = '#'                      # Blocked tile symbol (impassable)
-TRAPS    = ['X1', 'X2', 'X3', 'X4'] # Trap tiles
-REWARDS  = ['R1', 'R2']             # Reward tiles
-EMPTY    = ''                       # Empty tile
-
-# Hexagonal grid definition
-grid = [
-    ['', '', '', '', '', '', '', '', '', ''],
-    ['S', 'X2', '', 'X4', 'R1', '', '', '', '', ''],
-    ['', '', '', '', 'T', '', 'X3', 'R2', '#', ''],
-    ['', 'R1', '#', '#', '#', 'X3', '', 'T', 'X1', 'T'],
-    ['#', '', '', 'T', '', '', '#', '#', '', ''],
-    ['', '', 'X2', '', '#', 'R2', '#', '', '', ''],
-    ['', '', '', '', '', '', '', '', '', '']
-]
-
-ROWS, COLS = len(grid), len(grid[0])  # Grid dimensions
+# Map definitions and pathfinding (shared with search.py)
+from pathfinding import (
+    START, TREASURE, BLOCKED, TRAPS, REWARDS, EMPTY, grid, ROWS, COLS,
+    build_tables, find_best_treasure_path, a_star,
+)
 
 # ------------------------ Pygame Setup ------------------------ #
 TILE_SIZE = 40                         # Width of hex tile
@@ -69,22 +53,31 @@ def hex_to_pixel(r, c):
     return x, y
 
 # Converts pixel position to grid coordinates (for mouse click detection)
+# Inverts hex_to_pixel for the nearest column and its two neighbors instead of scanning every tile
 def pixel_to_hex(x, y):
-    for r in range(ROWS):
-        for c in range(COLS):
-            hx, hy = hex_to_pixel(r, c)
-            dist = math.hypot(hx - x, hy - y)
-            if dist < TILE_SIZE / 2:
-                return r, c
-    return None, None
+    best, best_dist = (None, None), (TILE_SIZE / 2) ** 2
+    c0 = round((x - TILE_SIZE / 2) / (TILE_SIZE * 0.75))
+    for c in (c0 - 1, c0, c0 + 1):
+        if not 0 <= c < COLS:
+            continue
+        r = round((y - HEX_H / 2 - (HEX_H / 2 if c % 2 == 1 else 0)) / HEX_H)
+        r = min(max(r, 0), ROWS - 1)  # Nearest row of this column that exists
+        hx, hy = hex_to_pixel(r, c)
+        dist = (hx - x) * (hx - x) + (hy - y) * (hy - y)
+        if dist < best_dist:
+            best, best_dist = (r, c), dist
+    return best
+
+# Offsets of the 6 corners of a hexagon from its center (trig done once here)
+CORNER_OFFSETS = [
+    (TILE_SIZE / 2 * math.cos(math.radians(angle)),
+     TILE_SIZE / 2 * math.sin(math.radians(angle)))
+    for angle in range(0, 360, 60)
+]
 
 # Returns pixel coordinates of the 6 corners of a hexagon
 def hex_corners(x, y):
-    return [
-        (x + TILE_SIZE / 2 * math.cos(math.radians(angle)),
-         y + TILE_SIZE / 2 * math.sin(math.radians(angle)))
-        for angle in range(0, 360, 60)
-    ]
+    return [(x + dx, y + dy) for dx, dy in CORNER_OFFSETS]
 
 # Finds the starting tile's coordinates
 def find_start():
@@ -94,96 +87,6 @@ def find_start():
                 return r, c
     return 0, 0
 
-# Gets all valid neighbors of a tile in hex grid
-def get_neighbors(r, c):
-    even = (c % 2 == 0)
-    dirs = [(-1, 0), (1, 0), (0, -1), (0, 1)]
-    dirs += [(-1 if even else 0, -1), (-1 if even else 0, 1)] if even else [(1, -1), (1, 1)]
-    neighbors = []
-    for dr, dc in dirs:
-        nr, nc = r + dr, c + dc
-        if 0 <= nr < ROWS and 0 <= nc < COLS and grid[nr][nc] != BLOCKED:
-            neighbors.append((nr, nc))
-    return neighbors
-
-# ------------------------ Pathfinding Algorithms ------------------------ #
-
-# Finds the best path to collect all treasures
-def find_best_treasure_path(start_pos, treasures, return_to_start=False):
-    if not treasures:
-        return []
-
-    best_path = []
-    min_total_cost = float('inf')
-
-    # Generate all possible orders of visiting treasures
-    for order in permutations(treasures):
-        current_pos = start_pos
-        total_path = []
-        total_cost = 0
-        valid = True
-
-        # Visit each treasure in current order
-        for target in order:
-            path_segment, cost = ucs(current_pos, target)
-            if not path_segment:
-                valid = False
-                break
-            total_path += path_segment
-            total_cost += cost
-            current_pos = target
-
-        # Optionally return to start after collecting all treasures
-        if valid and return_to_start:
-            return_path, return_cost = ucs(current_pos, start_pos)
-            if return_path:
-                total_path += return_path
-                total_cost += return_cost
-            else:
-                valid = False
-
-        # Update best path if current permutation is better
-        if valid and total_cost < min_total_cost:
-            min_total_cost = total_cost
-            best_path = total_path
-
-    return best_path
-
-# Uniform-Cost Search Algorithm
-def ucs(start, goal):
-    open_set = [(0, start)]  # (cost, position)
-    came_from = {}
-    cost_so_far = {start: 0}
-
-    while open_set:
-        current_cost, current = heapq.heappop(open_set)
-
-        if current == goal:
-            path = []
-            while current in came_from:
-                path.append(current)
-                current = came_from[current]
-            path.reverse()
-            return path, cost_so_far[goal]
-        
-        for neighbor in get_neighbors(*current):
-            tile = grid[neighbor[0]][neighbor[1]]
-            step_cost = 1.0  # Base cost
-
-            # Apply trap/reward modifiers
-            if tile in TRAPS:
-                step_cost *= 2
-            elif tile in REWARDS:
-                step_cost *= 0.5
-
-            new_cost = current_cost + step_cost
-            if neighbor not in cost_so_far or new_cost < cost_so_far[neighbor]:
-                cost_so_far[neighbor] = new_cost
-                came_from[neighbor] = current
-                heapq.heappush(open_set, (new_cost, neighbor))
-
-    return [], float('inf')
-
 # ------------------------ Drawing Functions ------------------------ #
 
 pygame.init()                             # Initialize pygame
@@ -191,32 +94,47 @@ screen = pygame.display.set_mode((WIDTH, HEIGHT)) # Create display
 pygame.display.set_caption("Hex Grid Treasure Hunt") # Window title
 font = pygame.font.SysFont('Arial', 18)   # Font for text
 
+# Hex geometry and tile labels never change, so build them once instead of every frame
+HEX_CENTERS = [[hex_to_pixel(r, c) for c in range(COLS)] for r in range(ROWS)]
+HEX_CORNERS = [[hex_corners(*HEX_CENTERS[r][c]) for c in range(COLS)] for r in range(ROWS)]
+TILE_LABELS = {tile: font.render(tile, True, (0, 0, 0)) for tile in COLORS if tile != 'PATH'}
+TILE_LABEL_OFFSETS = {tile: (label.get_width() // 2, label.get_height() // 2)
+                      for tile, label in TILE_LABELS.items()}  # Half size, to center labels
+
 health = 10                               # Initial health
 collected_treasures = set()              # Tracks collected treasures
 all_treasures = {(r, c) for r in range(ROWS) for c in range(COLS) if grid[r][c] == TREASURE} # All treasures in the grid
 
-# Draws the entire grid and player
-def draw_grid(player_pos, path=[]):
-    screen.fill((100, 100, 100))  # Clear background
+# Draws one hex tile (fill, border and label) onto a surface
+def draw_tile(surface, r, c, color):
+    x, y = HEX_CENTERS[r][c]
+    corners = HEX_CORNERS[r][c]
+    tile = grid[r][c]
+    pygame.draw.polygon(surface, color, corners)           # Fill hex
+    pygame.draw.polygon(surface, (0, 0, 0), corners, 1)    # Hex border
+    dx, dy = TILE_LABEL_OFFSETS[tile]                      # Tile label
+    surface.blit(TILE_LABELS[tile], (round(x) - dx, round(y) - dy))  # Draw text
+
+# Draws everything that does not change between frames onto BG_SURFACE
+# (call again whenever grid is modified)
+def build_background():
+    BG_SURFACE.fill((100, 100, 100))  # Clear background
     for r in range(ROWS):
         for c in range(COLS):
-            x, y = hex_to_pixel(r, c)
-            corners = hex_corners(x, y)
-            tile = grid[r][c]
-            color = COLORS.get(tile, COLORS[EMPTY])
-            if (r, c) in path:
-                color = COLORS['PATH']
-            pygame.draw.polygon(screen, color, corners)           # Fill hex
-            pygame.draw.polygon(screen, (0, 0, 0), corners, 1)    # Hex border
-            text = font.render(tile, True, (0, 0, 0))             # Tile label
-            screen.blit(text, text.get_rect(center=(x, y)))       # Draw text
-            if (r, c) == player_pos:                              # Draw player
-                pygame.draw.circle(screen, (0, 0, 0), (int(x), int(y)), 10)
-    draw_legend()
+            draw_tile(BG_SURFACE, r, c, COLORS.get(grid[r][c], COLORS[EMPTY]))
+    draw_legend(BG_SURFACE)
+
+# Draws the entire grid and player (static background plus path, player and status)
+def draw_grid(player_pos, path_set=frozenset()):
+    screen.blit(BG_SURFACE, (0, 0))
+    for r, c in path_set:
+        draw_tile(screen, r, c, COLORS['PATH'])
+    x, y = HEX_CENTERS[player_pos[0]][player_pos[1]]  # Draw player
+    pygame.draw.circle(screen, (0, 0, 0), (int(x), int(y)), 10)
     draw_status()
 
 # Draws legend box at bottom of screen
-def draw_legend():
+def draw_legend(surface):
     y = HEIGHT - 45
     x = 30
     legend_items = [
@@ -228,10 +146,10 @@ def draw_legend():
         ('. = Empty', COLORS[EMPTY]),
     ]
     for label, color in legend_items:
-        pygame.draw.rect(screen, color, (x, y, 20, 20))
-        pygame.draw.rect(screen, (0, 0, 0), (x, y, 20, 20), 1)
+        pygame.draw.rect(surface, color, (x, y, 20, 20))
+        pygame.draw.rect(surface, (0, 0, 0), (x, y, 20, 20), 1)
         text = font.render(label, True, (255, 255, 255))
-        screen.blit(text, (x + 25, y))
+        surface.blit(text, (x + 25, y))
         x += 150
 
 # Shows player's health and treasure count
@@ -247,59 +165,23 @@ def display_description(desc):
     rect = text.get_rect(center=(WIDTH // 2, HEIGHT - 110))
     screen.blit(text, rect)
 
-# ------------------------ Game Logic ------------------------ #
-
-'''
-# Heuristic for A* (Euclidean distance)
-def heuristic(a, b):
-    ax, ay = hex_to_pixel(*a)
-    bx, by = hex_to_pixel(*b)
-    return math.hypot(ax - bx, ay - by)
-'''
-'''
-# A* pathfinding implementation
-def a_star(start, goal):
-    open_set = [(0, start)]
-    came_from = {}
-    g_score = {start: 0}
-
-    while open_set:
-        _, current = heapq.heappop(open_set)
-
-        if current == goal:
-            path = []
-            while current in came_from:
-                path.append(current)
-                current = came_from[current]
-            path.reverse()
-            return path
-
-        for neighbor in get_neighbors(*current):
-            cost = 1
-            tile = grid[neighbor[0]][neighbor[1]]
-            if tile == 'X1': cost *= 2
-            if tile == 'R1': cost *= 0.5
-            tentative_g = g_score[current] + cost
-            if neighbor not in g_score or tentative_g < g_score[neighbor]:
-                came_from[neighbor] = current
-                g_score[neighbor] = tentative_g
-                f_score = tentative_g + heuristic(neighbor, goal)
-                heapq.heappush(open_set, (f_score, neighbor))
-
-    return []
-'''
+BG_SURFACE = pygame.Surface((WIDTH, HEIGHT))  # Pre-rendered hexes, labels and legend
+build_background()
 
 # ------------------------ Main Game Loop ------------------------ #
 def main():
     global health
     clock = pygame.time.Clock()
     player_r, player_c = find_start()  # Start position
-    path = []
+    path = deque()
+    path_set = Counter()               # Tiles left on path (with repeats), for O(1) lookups while drawing
+    pair_cache = {}                    # Search legs reused between path requests
+    tour_cache = {}                    # Best tours reused between path requests
     running = True
 
     while running:
         clock.tick(10)  # Limit FPS
-        draw_grid((player_r, player_c), path)
+        draw_grid((player_r, player_c), path_set)
         tile = grid[player_r][player_c]
         display_description(TileInfo.get(tile, "Nothing interesting here"))
         pygame.display.flip()
@@ -320,6 +202,10 @@ def main():
                 if (r, c) not in collected_treasures:
                     grid[r][c] = ''
                     all_treasures.remove((r, c))
+            build_tables()      # Grid changed, refresh the lookup tables
+            build_background()  # and the pre-rendered map
+            pair_cache.clear()  # and drop cached legs and tours that may be stale
+            tour_cache.clear()
 
         # Game over conditions
         if health <= 0 or collected_treasures == all_treasures:
@@ -335,7 +221,7 @@ def main():
                 mx, my = pygame.mouse.get_pos()
                 r, c = pixel_to_hex(mx, my)
                 if r is not None and (r, c) != (player_r, player_c):
-                    path = a_star((player_r, player_c), (r, c))
+                    path, _ = a_star((player_r, player_c), (r, c))
             elif event.type == pygame.KEYDOWN:
                 if event.key == pygame.K_SPACE and path:
                     player_r, player_c = path.pop(0)
@@ -351,10 +237,16 @@ def main():
                     #Compute best path covering all treasures
                     remaining_treasures = [t for t in all_treasures if t not in collected_treasures]
                     if remaining_treasures:
-                        path = find_best_treasure_path((player_r, player_c), remaining_treasures)
+                        path = deque(find_best_treasure_path((player_r, player_c), remaining_treasures,
+                                                             pair_cache=pair_cache,
+                                                             tour_cache=tour_cache))
+                        path_set = Counter(path)
             elif event.type == pygame.KEYDOWN:
                 if event.key == pygame.K_SPACE and path:
-                    player_r, player_c = path.pop(0)
+                    player_r, player_c = path.popleft()
+                    path_set[(player_r, player_c)] -= 1  # Path may revisit a tile, so count down
+                    if not path_set[(player_r, player_c)]:
+                        del path_set[(player_r, player_c)]
                     
         # Arrow key movement
         keys = pygame.key.get_pressed()
@@ -0,0 +1,379 @@
+# Import libraries
+import heapq                        # Priority queue for A*
+import numpy as np                  # Flat arrays for the tile and cost tables
+from collections import deque       # Bucket queue for UCS
+
+# Optional: Numba JIT-compiles the UCS inner loop (falls back to pure Python without it)
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+# ------------------------ Map Definitions ------------------------ #
+START    = 'S'                      # Start tile symbol
+TREASURE = 'T'                      # Treasure tile symbol
+BLOCKED  = '#'                      # Blocked tile symbol (impassable)
+TRAPS    = ['X1', 'X2', 'X3', 'X4'] # Trap tiles
+REWARDS  = ['R1', 'R2']             # Reward tiles
+EMPTY    = ''                       # Empty tile
+
+# Hexagonal grid definition
+grid = [
+    ['', '', '', '', '', '', '', '', '', ''],
+    ['S', 'X2', '', 'X4', 'R1', '', '', '', '', ''],
+    ['', '', '', '', 'T', '', 'X3', 'R2', '#', ''],
+    ['', 'R1', '#', '#', '#', 'X3', '', 'T', 'X1', 'T'],
+    ['#', '', '', 'T', '', '', '#', '#', '', ''],
+    ['', '', 'X2', '', '#', 'R2', '#', '', '', ''],
+    ['', '', '', '', '', '', '', '', '', '']
+]
+
+ROWS, COLS = len(grid), len(grid[0])  # Grid dimensions
+
+# Small integer code for each tile type, used by the NumPy tile table
+TILE_CODES = {
+    EMPTY: 0, START: 1, TREASURE: 2, BLOCKED: 255,
+    'X1': 11, 'X2': 12, 'X3': 13, 'X4': 14,
+    'R1': 21, 'R2': 22,
+}
+TRAP_CODES   = [TILE_CODES[tile] for tile in TRAPS]
+REWARD_CODES = [TILE_CODES[tile] for tile in REWARDS]
+
+# ------------------------ Grid Utilities ------------------------ #
+
+# Neighbor offsets (dr, dc); odd columns sit half a tile lower than even ones
+DIRS_EVEN = ((-1, 0), (1, 0), (0, -1), (0, 1), (-1, -1), (-1, 1))
+DIRS_ODD  = ((-1, 0), (1, 0), (0, -1), (0, 1), (1, -1), (1, 1))
+
+# Gets all valid neighbors of a tile in hex grid
+def get_neighbors(r, c):
+    dirs = DIRS_EVEN if (c & 1) == 0 else DIRS_ODD
+    neighbors = []
+    for dr, dc in dirs:
+        nr, nc = r + dr, c + dc
+        if 0 <= nr < ROWS and 0 <= nc < COLS and TILE[nr, nc] != TILE_CODES[BLOCKED]:
+            neighbors.append((nr, nc))
+    return neighbors
+
+# ------------------------ Precomputed Lookup Tables ------------------------ #
+# Tiles are addressed by flat index r * COLS + c inside the search loops.
+# The NumPy arrays are the source of truth; the search loops index the tuple
+# copies, since indexing a NumPy array one element at a time from Python is slower
+TILE = np.zeros((ROWS, COLS), dtype=np.uint8)  # Tile code of each cell (see TILE_CODES)
+STEP_COST_ARRAY = None                         # Cost of stepping onto each tile (flat float32)
+HALF_STEPS_ARRAY = None                        # Same cost in half-step units (flat int64)
+NBR_INDPTR = NBR_INDICES = None                # Neighbor table in CSR form for the JIT kernel
+NEIGHBORS = [[] for _ in range(ROWS * COLS)]   # Passable neighbor indices of each tile
+
+# Axial hex coordinates of each flat index (static), for hex-distance bounds in UCS
+AXIAL_Q = np.tile(np.arange(COLS, dtype=np.int64), ROWS)
+AXIAL_R = np.repeat(np.arange(ROWS, dtype=np.int64), COLS) - (AXIAL_Q - (AXIAL_Q & 1)) // 2
+AXIAL = tuple(zip(AXIAL_Q.tolist(), AXIAL_R.tolist()))
+STEP_COST = ()                                 # Tuple copy of STEP_COST_ARRAY (for A*)
+HALF_STEPS = ()                                # Tuple copy of HALF_STEPS_ARRAY (for UCS buckets)
+
+# Rebuilds the lookup tables (call again whenever grid is modified)
+def build_tables():
+    global STEP_COST_ARRAY, HALF_STEPS_ARRAY, NBR_INDPTR, NBR_INDICES, STEP_COST, HALF_STEPS
+    TILE[:] = [[TILE_CODES[tile] for tile in row] for row in grid]
+    codes = TILE.ravel()
+    STEP_COST_ARRAY = np.ones(ROWS * COLS, dtype=np.float32)
+    STEP_COST_ARRAY[np.isin(codes, TRAP_CODES)] = 2.0
+    STEP_COST_ARRAY[np.isin(codes, REWARD_CODES)] = 0.5
+    HALF_STEPS_ARRAY = (STEP_COST_ARRAY * 2).astype(np.int64)
+    STEP_COST = tuple(STEP_COST_ARRAY.tolist())
+    HALF_STEPS = tuple(HALF_STEPS_ARRAY.tolist())
+
+    for r in range(ROWS):
+        for c in range(COLS):
+            NEIGHBORS[r * COLS + c] = [nr * COLS + nc for nr, nc in get_neighbors(r, c)]
+
+    # Neighbors of tile i are NBR_INDICES[NBR_INDPTR[i]:NBR_INDPTR[i + 1]]
+    NBR_INDPTR = np.cumsum([0] + [len(n) for n in NEIGHBORS]).astype(np.int32)
+    NBR_INDICES = np.array([i for n in NEIGHBORS for i in n], dtype=np.int32)
+
+build_tables()
+
+# ------------------------ Pathfinding Algorithms ------------------------ #
+
+# Finds the best path to collect all treasures (Held-Karp dynamic programming)
+def find_best_treasure_path(start_pos, treasures, return_to_start=False, pair_cache=None,
+                            tour_cache=None):
+    if not treasures:
+        return []
+
+    # (src, dst) -> (path, cost); pass a shared dict to reuse legs between calls
+    if pair_cache is None:
+        pair_cache = {}
+
+    # (remaining treasures, position, tile to return to or None) -> best path; pass a shared
+    # dict to reuse tours between calls (filled with every suffix of each tour found below)
+    return_pos = start_pos if return_to_start else None
+    if tour_cache is not None:
+        key = (frozenset(treasures), start_pos, return_pos)
+        if key in tour_cache:
+            return list(tour_cache[key])
+
+    # Point 0 is the start position, points 1..k are the treasures
+    points = [start_pos] + list(treasures)
+    n = len(points)
+    k = n - 1
+
+    # Precompute the cost and path segment between every pair of points
+    dist = [[0.0] * n for _ in range(n)]
+    segments = [[[] for _ in range(n)] for _ in range(n)]
+    for i in range(n):
+        for j in range(n):
+            if i != j:
+                pair = (points[i], points[j])
+                if pair not in pair_cache:
+                    pair_cache[pair] = a_star(*pair)
+                segments[i][j], dist[i][j] = pair_cache[pair]
+
+    # Greedy nearest-treasure tour gives an incumbent cost to prune the DP with
+    upper_bound = 0.0
+    current = 0
+    unvisited = set(range(1, n))
+    while unvisited:
+        nearest = min(unvisited, key=lambda j: dist[current][j])
+        upper_bound += dist[current][nearest]
+        unvisited.remove(nearest)
+        current = nearest
+    if return_to_start:
+        upper_bound += dist[current][0]
+
+    # dp[mask][i] = cheapest cost from start visiting the treasures in mask, ending at treasure i
+    full = (1 << k) - 1
+    dp = [[float('inf')] * n for _ in range(full + 1)]
+    parent = [[0] * n for _ in range(full + 1)]
+    for i in range(1, n):
+        dp[1 << (i - 1)][i] = dist[0][i]
+
+    for mask in range(1, full + 1):
+        for i in range(1, n):
+            bit = 1 << (i - 1)
+            prev_mask = mask ^ bit
+            if not mask & bit or not prev_mask:
+                continue
+            for j in range(1, n):
+                if prev_mask & (1 << (j - 1)):
+                    cost = dp[prev_mask][j] + dist[j][i]
+                    # Branch and bound: a partial tour already dearer than the incumbent is dropped
+                    if cost > upper_bound:
+                        continue
+                    if cost < dp[mask][i]:
+                        dp[mask][i] = cost
+                        parent[mask][i] = j
+
+    # Pick the cheapest final treasure (optionally paying the way back to start)
+    min_total_cost = float('inf')
+    last = 0
+    for i in range(1, n):
+        total_cost = dp[full][i] + (dist[i][0] if return_to_start else 0)
+        if total_cost < min_total_cost:
+            min_total_cost = total_cost
+            last = i
+
+    if min_total_cost == float('inf'):
+        return []
+
+    # Walk the parent pointers back to recover the visiting order
+    order = []
+    mask = full
+    while last:
+        order.append(last)
+        mask, last = mask ^ (1 << (last - 1)), parent[mask][last]
+    order.append(0)
+    order.reverse()
+    if return_to_start:
+        order.append(0)
+
+    # Every suffix of an optimal tour is the optimal tour for the treasures it still
+    # visits, so cache each one (re-planning from a collected treasure is then a lookup)
+    if tour_cache is not None:
+        for m in range(k):
+            suffix = []
+            for i, j in zip(order[m:], order[m + 1:]):
+                suffix += segments[i][j]
+            remaining = frozenset(points[t] for t in order[m + 1:k + 1])
+            tour_cache[(remaining, points[order[m]], return_pos)] = suffix
+
+    # Stitch the cached segments together
+    best_path = []
+    for i, j in zip(order, order[1:]):
+        best_path += segments[i][j]
+    return best_path
+
+# Uniform-Cost Search Algorithm
+def ucs(start, goal):
+    start_idx, goal_idx = start[0] * COLS + start[1], goal[0] * COLS + goal[1]
+    if ucs_kernel is not None:
+        cost, came_from = ucs_kernel(start_idx, goal_idx, NBR_INDPTR, NBR_INDICES, HALF_STEPS_ARRAY,
+                                     AXIAL_Q, AXIAL_R)
+    else:
+        cost, came_from = ucs_buckets(start_idx, goal_idx)
+
+    if cost < 0:
+        return [], float('inf')
+
+    path = []
+    current = goal_idx
+    while current != start_idx:
+        path.append(divmod(int(current), COLS))
+        current = came_from[current]
+    path.reverse()
+    return path, int(cost) / 2
+
+# Pure-Python UCS over flat indices, returns (cost in half-steps or -1, came_from)
+# Step costs are 0.5, 1 or 2, so costs are kept in half-step units and the
+# frontier is a bucket queue indexed by cost instead of a binary heap.
+# Each step costs at least one half-step, so the hex distance to the goal is an
+# admissible bound: tiles that cannot beat the best route found so far are not queued
+def ucs_buckets(start_idx, goal_idx):
+    buckets = [deque([start_idx])]  # buckets[cost] = tile indices reached at that cost
+    came_from = [-1] * (ROWS * COLS)
+    cost_so_far = [float('inf')] * (ROWS * COLS)
+    cost_so_far[start_idx] = 0
+    current_cost = 0
+    best_goal = -1  # Cheapest cost to the goal seen so far (-1 until it is first reached)
+    goal_q, goal_r = AXIAL[goal_idx]
+
+    while current_cost < len(buckets):
+        if not buckets[current_cost]:
+            current_cost += 1
+            continue
+        current = buckets[current_cost].popleft()
+        if cost_so_far[current] < current_cost:
+            continue  # Stale entry, a cheaper route was found later
+
+        if current == goal_idx:
+            return current_cost, came_from
+
+        for neighbor in NEIGHBORS[current]:
+            new_cost = current_cost + HALF_STEPS[neighbor]
+            if new_cost < cost_so_far[neighbor]:
+                if best_goal >= 0:
+                    q, r = AXIAL[neighbor]
+                    dq, dr = q - goal_q, r - goal_r
+                    if new_cost + (abs(dq) + abs(dr) + abs(dq + dr)) // 2 >= best_goal:
+                        continue
+                if neighbor == goal_idx:
+                    best_goal = new_cost
+                cost_so_far[neighbor] = new_cost
+                came_from[neighbor] = current
+                while len(buckets) <= new_cost:
+                    buckets.append(deque())
+                buckets[new_cost].append(neighbor)
+
+    return -1, came_from
+
+# Same search compiled with Numba: int64 costs, int32 parents and an array binary heap
+# whose keys pack (cost, tile) as cost * n + tile
+if njit is not None:
+    @njit(cache=True, boundscheck=False)
+    def ucs_kernel(start_idx, goal_idx, indptr, indices, half_steps, axial_q, axial_r):
+        n = half_steps.shape[0]
+        best_goal = np.iinfo(np.int64).max  # Same hex-distance bound as ucs_buckets
+        cost_so_far = np.full(n, -1, dtype=np.int64)
+        came_from = np.full(n, -1, dtype=np.int32)
+        heap = np.empty(indices.shape[0] + 1, dtype=np.int64)  # Each edge relaxes at most once
+        heap[0] = start_idx
+        size = 1
+        cost_so_far[start_idx] = 0
+
+        while size > 0:
+            key = heap[0]
+            size -= 1
+            item = heap[size]
+            i = 0
+            while True:  # Sift the last item down from the root
+                child = 2 * i + 1
+                if child >= size:
+                    break
+                if child + 1 < size and heap[child + 1] < heap[child]:
+                    child += 1
+                if heap[child] >= item:
+                    break
+                heap[i] = heap[child]
+                i = child
+            if size > 0:
+                heap[i] = item
+
+            current_cost, current = key // n, key % n
+            if current_cost > cost_so_far[current]:
+                continue  # Stale entry
+            if current == goal_idx:
+                return current_cost, came_from
+
+            for e in range(indptr[current], indptr[current + 1]):
+                neighbor = indices[e]
+                new_cost = current_cost + half_steps[neighbor]
+                if cost_so_far[neighbor] < 0 or new_cost < cost_so_far[neighbor]:
+                    dq = axial_q[neighbor] - axial_q[goal_idx]
+                    dr = axial_r[neighbor] - axial_r[goal_idx]
+                    if new_cost + (abs(dq) + abs(dr) + abs(dq + dr)) // 2 >= best_goal:
+                        continue
+                    if neighbor == goal_idx:
+                        best_goal = new_cost
+                    cost_so_far[neighbor] = new_cost
+                    came_from[neighbor] = current
+                    item = new_cost * n + neighbor
+                    i = size
+                    size += 1
+                    while i > 0:  # Sift the new item up
+                        parent = (i - 1) // 2
+                        if heap[parent] <= item:
+                            break
+                        heap[i] = heap[parent]
+                        i = parent
+                    heap[i] = item
+
+        return -1, came_from
+else:
+    ucs_kernel = None
+
+# Hex distance between two tiles (offset coordinates converted to axial)
+def hex_distance(a, b):
+    aq, ar = a[1], a[0] - (a[1] - (a[1] & 1)) // 2
+    bq, br = b[1], b[0] - (b[1] - (b[1] & 1)) // 2
+    dq, dr = aq - bq, ar - br
+    return (abs(dq) + abs(dr) + abs(dq + dr)) // 2
+
+# Heuristic for A* (hex distance times the cheapest step cost, so it never overestimates)
+def heuristic(a, b):
+    return 0.5 * hex_distance(a, b)
+
+# A* pathfinding implementation
+def a_star(start, goal):
+    start_idx, goal_idx = start[0] * COLS + start[1], goal[0] * COLS + goal[1]
+    open_set = [(heuristic(start, goal), 0, start_idx)]  # (f, g, tile index)
+    came_from = [-1] * (ROWS * COLS)
+    g_score = [float('inf')] * (ROWS * COLS)
+    g_score[start_idx] = 0
+    closed = [False] * (ROWS * COLS)
+
+    while open_set:
+        _, current_g, current = heapq.heappop(open_set)
+        if closed[current]:
+            continue
+
+        if current == goal_idx:
+            path = []
+            while current != start_idx:
+                path.append(divmod(current, COLS))
+                current = came_from[current]
+            path.reverse()
+            return path, g_score[goal_idx]
+        closed[current] = True
+
+        for neighbor in NEIGHBORS[current]:
+            if closed[neighbor]:
+                continue
+            tentative_g = current_g + STEP_COST[neighbor]
+            if tentative_g < g_score[neighbor]:
+                came_from[neighbor] = current
+                g_score[neighbor] = tentative_g
+                f_score = tentative_g + heuristic(divmod(neighbor, COLS), goal)
+                heapq.heappush(open_set, (f_score, tentative_g, neighbor))
+
+    return [], float('inf')